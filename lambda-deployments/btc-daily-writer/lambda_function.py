@@ -22,16 +22,19 @@ def fetch_binance_1d(symbol: str, limit: int = 1500):
         f"https://api.binance.com/api/v3/klines?symbol={symbol}&interval=1d&limit={limit}"
     )
     with urllib.request.urlopen(url, timeout=10) as r:
-        data = json.loads(r.read().decode("utf-8"))
+        # json.loads takes the raw bytes; no intermediate str for the 1500-row payload
+        data = json.loads(r.read())
     # Each kline: [openTime, open, high, low, close, volume, closeTime, ...]
     out = []
     for k in data:
         open_ts, close_price, close_ts = int(k[0]), float(k[4]), int(k[6])
+        # Convert each timestamp once; the date is the close time's ISO prefix
+        close_iso = _utc_iso(close_ts)
         out.append(
             {
-                "date": _utc_iso(close_ts)[:10],
+                "date": close_iso[:10],
                 "open_time": _utc_iso(open_ts),
-                "close_time": _utc_iso(close_ts),
+                "close_time": close_iso,
                 "close": close_price,
             }
         )
@@ -2,6 +2,7 @@ import os
 import json
 import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Tuple, Optional
 
 import boto3
@@ -10,6 +11,10 @@ from botocore.exceptions import ClientError
 
 BUCKET_ENV = os.getenv("BUCKET")  # Optional override; otherwise taken from event
 
+# Clients are created once per container and reused across warm invocations
+S3_CLIENT = boto3.client("s3")
+_SES_CLIENTS: Dict[str, Any] = {}
+
 # Known env base prefixes
 ADMIN_BASE = "signal-dashboard/data"
 PULSE_BASE = "descartes-ml/signal-dashboard/data"
@@ -98,8 +103,8 @@ def read_last_pv(s3, bucket: str, env: str, strategy: str) -> float:
     txt = read_object_text(s3, bucket, key)
     if not txt:
         return CAPITAL
-    last_pv = None
-    for line in txt.splitlines():
+    # Scan from the end: the first usable row is the last PV, no need to parse the whole log
+    for line in reversed(txt.splitlines()):
         line = line.strip()
         if not line:
             continue
@@ -107,10 +112,10 @@ def read_last_pv(s3, bucket: str, env: str, strategy: str) -> float:
             row = json.loads(line)
             pv = float(row.get("portfolio_value", row.get("portfolioValue", 0.0)))
             if pv:
-                last_pv = pv
+                return pv
         except Exception:
             continue
-    return last_pv if last_pv is not None else CAPITAL
+    return CAPITAL
 
 
 def parse_weights_from_csv(csv_text: str) -> Dict[str, float]:
@@ -212,9 +217,15 @@ def read_env_pv_tail(s3, bucket: str, env: str, tail: int = 3) -> list:
     """Return last N entries from env-level PV log as parsed dicts (best-effort)."""
     key = f"{base_prefix_for(env)}/portfolio_value_log.jsonl"
     txt = read_object_text(s3, bucket, key) or ""
-    lines = [ln for ln in txt.splitlines() if ln.strip()]
+    # Walk back from the end instead of copying every non-empty line of the log
+    tail_lines = []
+    for ln in reversed(txt.splitlines()):
+        if ln.strip():
+            tail_lines.append(ln)
+            if len(tail_lines) == tail:
+                break
     out = []
-    for ln in lines[-tail:]:
+    for ln in reversed(tail_lines):
         try:
             out.append(json.loads(ln))
         except Exception:
@@ -223,7 +234,9 @@ def read_env_pv_tail(s3, bucket: str, env: str, tail: int = 3) -> list:
 
 
 def send_execution_email(ses_region: str, sender: str, recipient: str, subject: str, body: str) -> None:
-    ses = boto3.client("ses", region_name=ses_region)
+    ses = _SES_CLIENTS.get(ses_region)
+    if ses is None:
+        ses = _SES_CLIENTS[ses_region] = boto3.client("ses", region_name=ses_region)
     ses.send_email(
         Source=sender,
         Destination={"ToAddresses": [recipient]},
@@ -234,33 +247,58 @@ def send_execution_email(ses_region: str, sender: str, recipient: str, subject:
     )
 
 
+# (bucket, key) -> (ETag, parsed prices) of the last latest_prices.json read
+_PRICES_CACHE: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+
+
 def _read_prices_map(s3, bucket: str, key: str) -> Dict[str, Any]:
-    txt = read_object_text(s3, bucket, key)
+    """Return the prices map from a latest_prices.json.
+
+    Sends If-None-Match with the last seen ETag so unchanged files (common while
+    wait_for_full_coverage polls) come back as 304 without a body download.
+    """
+    cached = _PRICES_CACHE.get((bucket, key))
+    params = {"Bucket": bucket, "Key": key}
+    if cached:
+        params["IfNoneMatch"] = cached[0]
+    try:
+        obj = s3.get_object(**params)
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code in ("304", "NotModified") and cached:
+            return cached[1]
+        if code in ("NoSuchKey", "404"):
+            return {}
+        raise
+    txt = obj["Body"].read().decode("utf-8")
     if not txt:
         return {}
     try:
         doc = json.loads(txt)
-        return (doc.get("prices") or {}) if isinstance(doc, dict) else {}
+        prices = (doc.get("prices") or {}) if isinstance(doc, dict) else {}
     except Exception:
         return {}
+    if obj.get("ETag"):
+        _PRICES_CACHE[(bucket, key)] = (obj["ETag"], prices)
+    return prices
 
 
 def merge_env_prices(s3, bucket: str) -> Dict[str, Any]:
-    """Merge Admin and Pulse latest price maps (no network calls)."""
-    adm = _read_prices_map(s3, bucket, f"{ADMIN_BASE}/latest_prices.json")
-    pul = _read_prices_map(s3, bucket, f"{PULSE_BASE}/latest_prices.json")
+    """Merge Admin and Pulse latest price maps (no network calls).
+
+    Both S3 reads are independent, so they are issued concurrently.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        adm_f = pool.submit(_read_prices_map, s3, bucket, f"{ADMIN_BASE}/latest_prices.json")
+        pul_f = pool.submit(_read_prices_map, s3, bucket, f"{PULSE_BASE}/latest_prices.json")
+        adm, pul = adm_f.result(), pul_f.result()
     merged = {}
-    # prefer pulse values when present, then admin
+    # prefer pulse values when present, then admin (single pass over the union)
     for k, v in {**adm, **pul}.items():
         try:
             merged[k] = float(v)
         except Exception:
             continue
-    for k, v in pul.items():
-        try:
-            merged[k] = float(v)
-        except Exception:
-            continue
     return merged
 
 
@@ -327,7 +365,7 @@ def ensure_execution_anchor(s3, bucket: str, env: str, pv_pre: float, executed_a
 
 
 def handler(event, context):
-    s3 = boto3.client("s3")
+    s3 = S3_CLIENT
 
     # Support direct invocation payloads as well as S3 events
     records = event.get("Records") if isinstance(event, dict) else None
@@ -433,29 +471,38 @@ def handler(event, context):
                     for r in pv_tail
                 ]
                 uni_count = len(universe)
-                # CSV diagnostics
-                csv_syms = extract_csv_symbols(csv_text)
+                # CSV diagnostics (csv_syms was already extracted for the coverage wait)
                 csv_count = len(csv_syms)
-                missing_entry = sorted([sym for sym in csv_syms if sym not in ref_prices and ALIAS_MAP.get(sym) not in ref_prices])
                 price_map = (lp_doc.get("prices") or {}) if isinstance(lp_doc, dict) else {}
-                missing_mark = sorted([sym for sym in csv_syms if (sym not in price_map and ALIAS_MAP.get(sym) not in price_map)])
-                alias_used = sorted([sym for sym in csv_syms if ALIAS_MAP.get(sym) and ALIAS_MAP.get(sym) in price_map])
 
-                # Entry/Mark details for all portfolio symbols
+                # One pass per symbol: resolve the alias and mark key once, derive every diagnostic from them
                 baseline_key = f"{base_prefix}/{strategy}/daily_baseline.json"
                 mark_source = latest_prices_key_for(env)
+                missing_entry, missing_mark, alias_used = [], [], []
                 symbol_sources = []
                 for sym in csv_syms:
-                    entry_price = ref_prices.get(sym)
-                    mk_key = sym if sym in price_map else ALIAS_MAP.get(sym)
-                    mk_price = price_map.get(mk_key) if (mk_key and mk_key in price_map) else None
+                    alias = ALIAS_MAP.get(sym)
+                    if sym not in ref_prices and alias not in ref_prices:
+                        missing_entry.append(sym)
+                    alias_in_marks = bool(alias) and alias in price_map
+                    if alias_in_marks:
+                        alias_used.append(sym)
+                    direct = sym in price_map
+                    mk_key = sym if direct else alias
+                    has_mark = direct or alias_in_marks
+                    if not has_mark:
+                        missing_mark.append(sym)
+                    mk_price = price_map[mk_key] if has_mark else None
                     symbol_sources.append({
                         "symbol": sym,
                         "entry_key": sym,
-                        "entry_price": entry_price,
+                        "entry_price": ref_prices.get(sym),
                         "mark_key": mk_key or "missing",
                         "mark_price": mk_price,
                     })
+                missing_entry.sort()
+                missing_mark.sort()
+                alias_used.sort()
                 subject = f"Pulse Execution: {strategy} @ {now_iso}"
                 body = (
                     f"Env: {env}\n"
@@ -8,11 +8,13 @@ Triggered by CloudWatch Events every 60 seconds
 import json
 import urllib.request
 import urllib.parse
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 import boto3
 from botocore.exceptions import ClientError
 import ssl
 import os
+import traceback
 
 # Configuration - can be overridden by environment variables
 S3_BUCKET = os.environ.get("S3_BUCKET", "dfi-signal-dashboard")
@@ -23,6 +25,14 @@ PULSE_KEY_PREFIX = os.environ.get("PULSE_KEY_PREFIX", "descartes-ml/signal-dashb
 BENCH_PREFIX = os.environ.get("BENCH_PREFIX", "signal-dashboard/benchmarks/")
 BINANCE_FUTURES_API = "https://fapi.binance.com/fapi/v1/premiumIndex"
 BINANCE_SPOT_KLINES = "https://api.binance.com/api/v3/klines"
+# UTC days line up with epoch milliseconds, so a kline's date is plain integer division
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+MS_PER_DAY = 86_400_000
+
+# SSL context that doesn't verify certificates (built once, reused by every request)
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
 # List of symbols to fetch prices for
 SYMBOLS_TO_FETCH = [
@@ -38,26 +48,32 @@ def log(msg: str) -> None:
     print(f"[{datetime.now().isoformat()}] {msg}")
 
 def get_mark_prices(symbols: list[str]) -> dict:
-    """Fetches current mark prices for a list of symbols from Binance Futures API."""
+    """Fetches current mark prices for a list of symbols from Binance Futures API.
+
+    premiumIndex without a symbol returns every instrument, so one request
+    covers the whole list instead of one round trip per symbol.
+    """
     prices = {}
 
-    # Create SSL context that doesn't verify certificates
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
+    try:
+        with urllib.request.urlopen(BINANCE_FUTURES_API, context=SSL_CONTEXT, timeout=15) as response:
+            data = json.loads(response.read().decode())
+    except Exception as e:
+        log(f"❌ Error bulk fetching mark prices: {e}")
+        return prices
 
-    for symbol in symbols:
+    wanted = set(symbols)
+    for item in data if isinstance(data, list) else []:
         try:
-            params = urllib.parse.urlencode({'symbol': symbol})
-            url = f"{BINANCE_FUTURES_API}?{params}"
-
-            with urllib.request.urlopen(url, context=ssl_context, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                mark_price = float(data['markPrice'])
-                prices[symbol] = mark_price
-                log(f"✅ {symbol}: {mark_price}")
+            symbol = item.get('symbol')
+            if symbol in wanted:
+                prices[symbol] = float(item['markPrice'])
         except Exception as e:
-            log(f"❌ Error fetching price for {symbol}: {e}")
+            log(f"❌ Error parsing price for {item}: {e}")
+
+    missing = wanted.difference(prices)
+    if missing:
+        log(f"⚠️ No mark price for: {', '.join(sorted(missing))}")
     return prices
 
 
@@ -73,20 +89,16 @@ def fetch_btc_daily_klines(limit: int = 1500) -> list[dict]:
     })
     url = f"{BINANCE_SPOT_KLINES}?{params}"
 
-    # Reuse a permissive SSL context like get_mark_prices
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-
-    with urllib.request.urlopen(url, context=ssl_context, timeout=10) as response:
-        data = json.loads(response.read().decode())
+    with urllib.request.urlopen(url, context=SSL_CONTEXT, timeout=10) as response:
+        # json.loads takes the raw bytes; no intermediate str for the 1500-row payload
+        data = json.loads(response.read())
 
     out: list[dict] = []
     for k in data:
         # [openTime, open, high, low, close, volume, closeTime, ...]
         close_ts = int(k[6])
         close_price = float(k[4])
-        day = datetime.fromtimestamp(close_ts / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+        day = date.fromordinal(EPOCH_ORDINAL + close_ts // MS_PER_DAY).isoformat()
         out.append({'date': day, 'close': close_price})
     return out
 
@@ -137,6 +149,16 @@ def write_btc_benchmark(s3_client) -> None:
     except Exception as e:
         log(f"❌ BTC benchmark write failed: {e}")
 
+def put_latest_prices(s3_client, key_prefix: str, body: str) -> None:
+    """Write a serialized latest_prices.json payload under key_prefix."""
+    s3_client.put_object(
+        Bucket=S3_BUCKET,
+        Key=key_prefix + 'latest_prices.json',
+        Body=body,
+        ContentType='application/json',
+        CacheControl='no-store, max-age=0'
+    )
+
 def lambda_handler(event, context):
     """AWS Lambda handler for price writing."""
     log("🚀 Starting Latest Prices Writer Lambda...")
@@ -168,40 +190,19 @@ def lambda_handler(event, context):
             'prices': current_prices
         }
 
-        # Write to S3
-        s3_client.put_object(
-            Bucket=S3_BUCKET,
-            Key=S3_KEY_PREFIX + 'latest_prices.json',
-            Body=json.dumps(prices_data, indent=2),
-            ContentType='application/json',
-            CacheControl='no-store, max-age=0'
-        )
-
-        # Mirror to demo path
-        try:
-            s3_client.put_object(
-                Bucket=S3_BUCKET,
-                Key=DEMO_KEY_PREFIX + 'latest_prices.json',
-                Body=json.dumps(prices_data, indent=2),
-                ContentType='application/json',
-                CacheControl='no-store, max-age=0'
-            )
-            log("✅ Mirrored latest_prices.json to demo path")
-        except Exception as mirror_err:
-            log(f"⚠️ Failed to mirror latest_prices.json to demo path: {mirror_err}")
-
-        # Mirror to pulse path
-        try:
-            s3_client.put_object(
-                Bucket=S3_BUCKET,
-                Key=PULSE_KEY_PREFIX + 'latest_prices.json',
-                Body=json.dumps(prices_data, indent=2),
-                ContentType='application/json',
-                CacheControl='no-store, max-age=0'
-            )
-            log("✅ Mirrored latest_prices.json to pulse path")
-        except Exception as mirror_err2:
-            log(f"⚠️ Failed to mirror latest_prices.json to pulse path: {mirror_err2}")
+        # Serialize once; primary write must succeed, mirrors are best-effort
+        body = json.dumps(prices_data, indent=2)
+        put_latest_prices(s3_client, S3_KEY_PREFIX, body)
+        mirrors = (('demo', DEMO_KEY_PREFIX), ('pulse', PULSE_KEY_PREFIX))
+        # The mirror PUTs are independent; issue them together instead of back to back
+        with ThreadPoolExecutor(max_workers=len(mirrors)) as pool:
+            futures = [(label, pool.submit(put_latest_prices, s3_client, prefix, body)) for label, prefix in mirrors]
+            for label, fut in futures:
+                try:
+                    fut.result()
+                    log(f"✅ Mirrored latest_prices.json to {label} path")
+                except Exception as mirror_err:
+                    log(f"⚠️ Failed to mirror latest_prices.json to {label} path: {mirror_err}")
 
         log("✅ Latest prices updated successfully")
 
@@ -223,7 +224,6 @@ def lambda_handler(event, context):
 
     except Exception as e:
         log(f"❌ Lambda execution failed: {str(e)}")
-        import traceback
         log(f"Traceback: {traceback.format_exc()}")
         return {
             'statusCode': 500,
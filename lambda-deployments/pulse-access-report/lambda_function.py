@@ -70,16 +70,18 @@ def mark_redeemed(t: str, email: str, name: str, entity: str):
 
 def mark_ping(email: str, source_ip: str = '', ua: str = ''):
     # Find the most recent token for this email and update lastSeenAt
+    # Only token + issuedAt are needed to pick the latest; don't pull whole items back
     scan = ddb.scan(
         TableName=TABLE,
         FilterExpression='email = :e',
+        ProjectionExpression='#tk, issuedAt',
+        ExpressionAttributeNames={'#tk': 'token'},
         ExpressionAttributeValues={':e': {'S': email}}
     )
     items = [_unmarshall(i) for i in scan.get('Items', [])]
     if not items:
         return
-    items.sort(key=lambda x: x.get('issuedAt',''), reverse=True)
-    tok = items[0].get('token')
+    tok = max(items, key=lambda x: x.get('issuedAt','')).get('token')
     if not tok:
         return
     ddb.update_item(
@@ -90,6 +90,21 @@ def _copy_admin_to_pulse(name: str) -> Tuple[bool, Optional[str]]:
         return False, None
 
 
+def _pulse_latest_is_current(name: str, etag: Optional[str], version_id: Optional[str]) -> bool:
+    """True if Pulse latest.json already points at this CSV name/etag/version."""
+    try:
+        obj = s3.get_object(Bucket=BUCKET, Key=f"{PULSE_PREFIX}{LATEST_NAME}")
+        latest = json.loads(obj["Body"].read().decode("utf-8", "ignore"))
+    except Exception:
+        return False
+    return (
+        latest.get("filename") == name
+        and latest.get("latest_csv") == name
+        and latest.get("etag") == etag
+        and latest.get("version_id") == version_id
+    )
+
+
 def _write_pulse_latest(name: str, etag: Optional[str], version_id: Optional[str]) -> None:
     latest = {
         "filename": name,
@@ -122,7 +137,9 @@ def lambda_handler(event, _):
         _write_pulse_latest(name, admin_etag, admin_version)
         return {"statusCode": 200, "body": json.dumps({"ok": True, "copied": True, "name": name, "etag": admin_etag})}
 
-    # Ensure latest.json still refreshed even if etag matches (idempotent metadata update)
+    # CSV already in sync: only rewrite latest.json if it drifted from Admin
+    if _pulse_latest_is_current(name, admin_etag, admin_version):
+        return {"statusCode": 200, "body": json.dumps({"ok": True, "copied": False, "name": name, "etag": admin_etag, "latest_updated": False})}
     _write_pulse_latest(name, admin_etag, admin_version)
     return {"statusCode": 200, "body": json.dumps({"ok": True, "copied": False, "name": name, "etag": admin_etag})}
 
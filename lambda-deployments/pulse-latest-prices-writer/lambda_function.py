@@ -34,13 +34,15 @@ ADMIN_KEY = os.environ.get("ADMIN_KEY", "signal-dashboard/data/latest_prices.jso
 PULSE_KEY = os.environ.get("PULSE_KEY", "descartes-ml/signal-dashboard/data/latest_prices.json")
 
 s3 = boto3.client("s3")
+# Built once per container; loading the CA bundle is the expensive part of a TLS context
+SSL_CONTEXT = ssl.create_default_context()
 
 
 def _http_get_json(url: str, timeout_s: int = 12):
-    ctx = ssl.create_default_context()
     req = urllib.request.Request(url, headers={"User-Agent": "dfi-prices-writer/1.0"})
-    with urllib.request.urlopen(req, context=ctx, timeout=timeout_s) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    with urllib.request.urlopen(req, context=SSL_CONTEXT, timeout=timeout_s) as resp:
+        # json.loads accepts bytes directly; skip the intermediate str copy
+        return json.loads(resp.read())
 
 
 def discover_usdtm_perp_symbols() -> List[str]:
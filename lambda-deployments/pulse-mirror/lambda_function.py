@@ -14,6 +14,7 @@ Env:
 import os
 import json
 from datetime import datetime, timezone
+from typing import Optional
 import boto3
 from botocore.exceptions import ClientError
 
@@ -36,16 +37,32 @@ def _content_type_for(key: str) -> str:
         return "text/csv; charset=utf-8"
     return "application/octet-stream"
 
-def copy_one(key: str, dest_prefix: str) -> bool:
+def head_source(key: str) -> Optional[dict]:
+    """HEAD the source object once; the result is shared by every destination."""
     src_key = f"{SRC_PREFIX}{key}"
-    dst_key = f"{dest_prefix}{key}"
     try:
-        # Ensure source exists (head once to get type if needed)
-        head = s3.head_object(Bucket=BUCKET, Key=src_key)
-        content_type = head.get("ContentType") or _content_type_for(key)
+        return s3.head_object(Bucket=BUCKET, Key=src_key)
     except ClientError as e:
         log(f"❌ head_object failed for {src_key}: {e}")
+        return None
+
+def copy_one(key: str, dest_prefix: str, head: Optional[dict]) -> bool:
+    # Source missing or unreadable: head_source already logged it
+    if head is None:
         return False
+    src_key = f"{SRC_PREFIX}{key}"
+    dst_key = f"{dest_prefix}{key}"
+    content_type = head.get("ContentType") or _content_type_for(key)
+
+    # Destination already holds the same bytes: a HEAD is cheaper than rewriting it
+    src_etag = head.get("ETag")
+    if src_etag:
+        try:
+            if s3.head_object(Bucket=BUCKET, Key=dst_key).get("ETag") == src_etag:
+                log(f"⏭️ {dst_key} already matches {src_key}")
+                return True
+        except ClientError:
+            pass  # missing or unreadable destination: fall through to the copy
 
     try:
         s3.copy_object(
@@ -65,10 +82,11 @@ def copy_one(key: str, dest_prefix: str) -> bool:
 def lambda_handler(event, _):
     overall_ok = 0
     per_dest_counts = {}
+    heads = {k: head_source(k) for k in KEYS}
     for dest in DST_PREFIXES:
         count_ok = 0
         for k in KEYS:
-            if copy_one(k, dest):
+            if copy_one(k, dest, heads[k]):
                 count_ok += 1
                 overall_ok += 1
         per_dest_counts[dest] = count_ok
@@ -15,6 +15,7 @@ Env Vars:
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Tuple
 import os
@@ -27,6 +28,13 @@ BASELINE_PREFIX = os.environ.get("BASELINE_PREFIX", "descartes-ml/signal-dashboa
 PRICES_PREFIX = os.environ.get("PRICES_PREFIX", "descartes-ml/signal-dashboard/data/")
 WRITE_PREFIX = os.environ.get("WRITE_PREFIX", "descartes-ml/signal-dashboard/data/")
 
+# Object keys are fixed per container; build them once instead of on every invocation
+BASELINE_KEY = f"{BASELINE_PREFIX}daily_baseline.json"
+LATEST_JSON_KEY = f"{BASELINE_PREFIX}latest.json"
+PRE_EXECUTION_KEY = f"{BASELINE_PREFIX}pre_execution.json"
+LATEST_PRICES_KEY = f"{PRICES_PREFIX}latest_prices.json"
+PV_LOG_KEY = f"{WRITE_PREFIX}portfolio_value_log.jsonl"
+
 s3 = boto3.client("s3")
 
 
@@ -73,36 +81,42 @@ def parse_jsonl(text: str) -> List[dict]:
 
 def dt_parse(ts: str) -> datetime:
     if ts.endswith("Z"):
-        return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        # fromisoformat is C-implemented; strptime goes through the pure-Python _strptime module
+        return datetime.fromisoformat(ts[:-1] + "+00:00")
     return datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc)
 
 
-def get_pulse_base() -> Tuple[float, dict]:
+def get_pulse_base(rows: List[dict]) -> Tuple[float, dict]:
     """Return (base_value, metadata) where base is first PV today if exists else yesterday EOD.
     Falls back to 1,000,000.0 if no history.
     """
-    key = f"{WRITE_PREFIX}portfolio_value_log.jsonl"
-    try:
-        text = load_text(key)
-        rows = parse_jsonl(text)
-    except Exception:
-        rows = []
     if not rows:
         return 1_000_000.0, {"reason": "no_history"}
 
     today = datetime.now(timezone.utc).date()
-    today_rows = [(dt_parse(r["timestamp"]), float(r.get("portfolio_value", 0))) for r in rows if r.get("timestamp")]
-    today_rows = [(t, v) for t, v in today_rows if t.date() == today]
-    if today_rows:
-        t0, v0 = sorted(today_rows, key=lambda x: x[0])[0]
+    yday = today - timedelta(days=1)
+    # Single pass: parse each timestamp once and track first-today / last-yesterday
+    first_today: Tuple[datetime, float] | None = None
+    last_yday: Tuple[datetime, float] | None = None
+    for r in rows:
+        if not r.get("timestamp"):
+            continue
+        t = dt_parse(r["timestamp"])
+        d = t.date()
+        if d == today:
+            if first_today is None or t < first_today[0]:
+                first_today = (t, float(r.get("portfolio_value", 0)))
+        elif d == yday:
+            if last_yday is None or t >= last_yday[0]:
+                last_yday = (t, float(r.get("portfolio_value", 0)))
+
+    if first_today:
+        t0, v0 = first_today
         return v0, {"reason": "first_today", "timestamp": t0.isoformat()}
 
     # else yesterday EOD
-    yday = today - timedelta(days=1)
-    y_rows = [(dt_parse(r["timestamp"]), float(r.get("portfolio_value", 0))) for r in rows if r.get("timestamp")]
-    y_rows = [(t, v) for t, v in y_rows if t.date() == yday]
-    if y_rows:
-        t_last, v_last = sorted(y_rows, key=lambda x: x[0])[-1]
+    if last_yday:
+        t_last, v_last = last_yday
         return v_last, {"reason": "yday_eod", "timestamp": t_last.isoformat()}
 
     return float(rows[-1].get("portfolio_value", 1_000_000.0)), {"reason": "fallback_last_any"}
@@ -157,29 +171,37 @@ def compute_daily_pnl_weight_based(baseline: dict, latest_prices: dict, capital:
     return daily_pnl, count
 
 
-def append_jsonl(key: str, entry: dict) -> None:
-    try:
-        existing = load_text(key)
-    except Exception:
-        existing = ""
+def append_jsonl(key: str, entry: dict, existing: str | None = None) -> str:
+    """Append entry to the JSONL object at key and return the new body.
+
+    Pass the already-loaded body as existing to skip re-reading the object.
+    """
+    if existing is None:
+        try:
+            existing = load_text(key)
+        except Exception:
+            existing = ""
     body = (existing or "") + json.dumps(entry, separators=(",", ":")) + "\n"
     s3.put_object(Bucket=S3_BUCKET, Key=key, Body=body.encode("utf-8"), ContentType="application/x-ndjson", CacheControl="no-store, max-age=0")
+    return body
 
 
-def ensure_execution_anchor(baseline: dict, pv_pre: float, write_prefix: str) -> None:
+def ensure_execution_anchor(baseline: dict, pv_pre: float, write_prefix: str, text: str | None = None) -> str | None:
     """Write a zero-PnL anchor at executed_at_utc if not already present.
 
     Idempotent: if an entry with the same timestamp already exists, do nothing.
+    Returns the log body after any append (text unchanged if nothing was written).
     """
     try:
         ts = str(baseline.get("executed_at_utc") or "").strip()
         if not ts:
-            return
+            return text
         log_key = f"{write_prefix}portfolio_value_log.jsonl"
-        text = load_text(log_key)
+        if text is None:
+            text = load_text(log_key)
         # quick idempotency check: does this exact timestamp exist already?
         if ts and text and ts in text:
-            return
+            return text
         anchor = {
             "timestamp": ts,
             "portfolio_value": float(pv_pre),
@@ -190,26 +212,31 @@ def ensure_execution_anchor(baseline: dict, pv_pre: float, write_prefix: str) ->
                 "note": "zero PnL at execution"
             }
         }
-        append_jsonl(log_key, anchor)
+        text = append_jsonl(log_key, anchor, existing=text)
         log(f"execution anchor written at {ts}")
     except Exception as e:
         log(f"anchor write failed: {e}")
+    return text
 
 
 def lambda_handler(event, context):
     now = datetime.now(timezone.utc)
     log("pulse-pv-logger start")
 
-    # Inputs: executed baseline and live prices
-    baseline = load_json(f"{BASELINE_PREFIX}daily_baseline.json")
-    latest_prices = load_json(f"{PRICES_PREFIX}latest_prices.json")
+    # Inputs: executed baseline and live prices (independent objects, fetched concurrently)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        baseline_f = pool.submit(load_json, BASELINE_KEY)
+        latest_prices_f = pool.submit(load_json, LATEST_PRICES_KEY)
+        baseline = baseline_f.result()
+        latest_prices = latest_prices_f.result()
+    # pre_execution.json feeds both the audit filename fallback and the anchor; read it once
+    pre = load_json(PRE_EXECUTION_KEY)
     # For audit only; try per-strategy latest.json then pre_execution.json
     def _get_latest_csv_filename() -> str | None:
-        doc = load_json(f"{BASELINE_PREFIX}latest.json")
+        doc = load_json(LATEST_JSON_KEY)
         fn = doc.get("latest_csv") or doc.get("filename")
         if fn:
             return str(fn)
-        pre = load_json(f"{BASELINE_PREFIX}pre_execution.json")
         if pre.get("csv_filename"):
             return str(pre["csv_filename"])
         return None
@@ -218,15 +245,26 @@ def lambda_handler(event, context):
     # Compute P&L (weight-based)
     daily_pnl, positions_count = compute_daily_pnl_weight_based(baseline, latest_prices, capital=1_000_000.0)
 
+    # Load the PV log once; base, anchor, guard and append all work off this copy
+    log_key = PV_LOG_KEY
+    try:
+        log_text = load_text(log_key)
+    except Exception:
+        log_text = ""
+    rows = parse_jsonl(log_text)
+
     # Determine Pulse base
-    pulse_base, base_meta = get_pulse_base()
+    pulse_base, base_meta = get_pulse_base(rows)
 
     # Ensure zero-PnL execution anchor once per baseline
     try:
-        pv_pre_for_anchor = float(load_json(f"{BASELINE_PREFIX}pre_execution.json").get("pv_pre", 1_000_000.0))
+        pv_pre_for_anchor = float(pre.get("pv_pre", 1_000_000.0))
     except Exception:
         pv_pre_for_anchor = 1_000_000.0
-    ensure_execution_anchor(baseline, pv_pre_for_anchor, WRITE_PREFIX)
+    anchored_text = ensure_execution_anchor(baseline, pv_pre_for_anchor, WRITE_PREFIX, log_text)
+    if anchored_text is not log_text:
+        rows = rows + parse_jsonl(anchored_text[len(log_text):])
+        log_text = anchored_text
 
     # New PV
     portfolio_value = pulse_base + daily_pnl
@@ -234,9 +272,6 @@ def lambda_handler(event, context):
     # Optional sanity vs last point; allow immediate post-execution jump
     last_ok = True
     try:
-        log_key = f"{WRITE_PREFIX}portfolio_value_log.jsonl"
-        text = load_text(log_key)
-        rows = parse_jsonl(text)
         if rows:
             last = rows[-1]
             last_pv = float(last.get("portfolio_value", last.get("portfolioValue", 0)))
@@ -263,13 +298,13 @@ def lambda_handler(event, context):
             "pulse_base_reason": base_meta.get("reason"),
             "csv_filename": latest_csv,
             "inputs": {
-                "baseline": f"{BASELINE_PREFIX}daily_baseline.json",
-                "latest_prices": f"{PRICES_PREFIX}latest_prices.json"
+                "baseline": BASELINE_KEY,
+                "latest_prices": LATEST_PRICES_KEY
             }
         }
     }
 
-    append_jsonl(f"{WRITE_PREFIX}portfolio_value_log.jsonl", entry)
+    append_jsonl(log_key, entry, existing=log_text)
 
     return {"statusCode": 200, "body": json.dumps({"ok": True, "pv": portfolio_value, "positions": positions_count})}
 
@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import json
 import urllib.request
-import urllib.parse
 from datetime import datetime, timezone
 import boto3
 from botocore.exceptions import ClientError
@@ -30,6 +29,11 @@ WRITE_PREFIX = os.environ.get("WRITE_PREFIX", "descartes-ml/signal-dashboard/dat
 
 BINANCE_FUTURES_API = "https://fapi.binance.com/fapi/v1/premiumIndex"
 
+# SSL context that doesn't verify certificates (built once, reused by every request)
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
 # Symbols to fetch
 SYMBOLS_TO_FETCH = [
     'BTCUSDT', 'ETHUSDT', 'XRPUSDT', 'BNBUSDT', 'SOLUSDT', 'TRXUSDT',
@@ -45,22 +49,37 @@ def log(msg: str) -> None:
 
 
 def get_mark_prices(symbols: list[str]) -> dict:
+    """Mark prices for symbols from a single unparameterised premiumIndex request."""
     prices: dict[str, float] = {}
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    for symbol in symbols:
+    try:
+        with urllib.request.urlopen(BINANCE_FUTURES_API, context=SSL_CONTEXT, timeout=15) as resp:
+            data = json.loads(resp.read())
+    except Exception as e:
+        log(f"Error bulk fetching mark prices: {e}")
+        return prices
+
+    wanted = set(symbols)
+    for item in data if isinstance(data, list) else []:
         try:
-            params = urllib.parse.urlencode({'symbol': symbol})
-            url = f"{BINANCE_FUTURES_API}?{params}"
-            with urllib.request.urlopen(url, context=ssl_context, timeout=10) as resp:
-                data = json.loads(resp.read().decode())
-                prices[symbol] = float(data['markPrice'])
+            symbol = item.get('symbol')
+            if symbol in wanted:
+                prices[symbol] = float(item['markPrice'])
         except Exception as e:
-            log(f"Error fetching price for {symbol}: {e}")
+            log(f"Error parsing price for {item}: {e}")
+
+    missing = wanted.difference(prices)
+    if missing:
+        log(f"No mark price for: {', '.join(sorted(missing))}")
     return prices
 
 
+def csv_cell(values: list[str], idx, default):
+    """Stripped cell at idx, or default if the column is absent or the row is short."""
+    if idx is None or idx >= len(values):
+        return default
+    return values[idx].strip()
+
+
 def load_s3_json(s3_client, key: str) -> dict:
     try:
         response = s3_client.get_object(Bucket=S3_BUCKET, Key=key)
@@ -146,6 +165,10 @@ def lambda_handler(event, context):
 
     headers = lines[0].split(',')
     header_index = {h.strip(): i for i, h in enumerate(headers)}
+    # Resolve the columns once rather than re-looking them up for every row
+    ticker_idx = header_index.get('ticker')
+    notional_idx = header_index.get('target_notional')
+    contracts_idx = header_index.get('target_contracts')
 
     baseline_prices: dict[str, float] = baseline_data['prices']
     daily_pnl = 0.0
@@ -154,13 +177,13 @@ def lambda_handler(event, context):
     for row in lines[1:]:
         values = row.split(',')
         # Extract fields safely
-        ticker = values[header_index.get('ticker', -1)].strip().replace('_', '') if header_index.get('ticker', -1) >= 0 and header_index['ticker'] < len(values) else ''
+        ticker = csv_cell(values, ticker_idx, '').replace('_', '')
         try:
-            target_notional = float(values[header_index.get('target_notional', -1)]) if header_index.get('target_notional', -1) >= 0 and header_index['target_notional'] < len(values) else 0.0
+            target_notional = float(csv_cell(values, notional_idx, 0.0))
         except Exception:
             target_notional = 0.0
         try:
-            target_contracts = float(values[header_index.get('target_contracts', -1)]) if header_index.get('target_contracts', -1) >= 0 and header_index['target_contracts'] < len(values) else 0.0
+            target_contracts = float(csv_cell(values, contracts_idx, 0.0))
         except Exception:
             target_contracts = 0.0
 
@@ -23,7 +23,8 @@ PRE_EXEC_KEY = os.environ.get('PRE_EXEC_KEY', 'signal-dashboard/data/pre_executi
 
 def _dt(s: str) -> datetime:
     if s.endswith('Z'):
-        return datetime.strptime(s, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+        # fromisoformat is C-implemented; strptime goes through the pure-Python _strptime module
+        return datetime.fromisoformat(s[:-1] + '+00:00')
     return datetime.fromisoformat(s.replace('Z', '+00:00')).astimezone(timezone.utc)
 
 def _iso(dt: datetime) -> str:
@@ -58,33 +59,31 @@ def read_json(bucket: str, key: str) -> dict:
         return {}
 
 def write_jsonl(bucket: str, key: str, rows: list[dict]) -> None:
+    # Rows come from merge_pulse_with_admin with timestamps already normalized
     body = '\n'.join(json.dumps({
-        'timestamp': _iso(_dt(r['timestamp'])),
+        'timestamp': r['timestamp'],
         'portfolio_value': float(r['portfolio_value'])
     }, separators=(',', ':')) for r in rows) + '\n'
     s3.put_object(Bucket=bucket, Key=key, Body=body.encode('utf-8'), ContentType='application/json', CacheControl='no-store, max-age=0')
 
-def merge_pulse_with_admin(pulse: list[dict], admin: list[dict], pv_pre: float | None = None) -> list[dict]:
-    today = datetime.now(timezone.utc).date()
-    # Keep Pulse strictly before today
-    kept: list[dict] = []
-    for p in pulse:
+def _points(rows: list[dict]) -> list[tuple[datetime, float]]:
+    """Parse each row's timestamp and PV once; rows that fail to parse are skipped."""
+    out: list[tuple[datetime, float]] = []
+    for r in rows:
         try:
-            d = _dt(p['timestamp']).date()
-            if d < today:
-                kept.append({'timestamp': _iso(_dt(p['timestamp'])), 'portfolio_value': float(p.get('portfolio_value', p.get('portfolioValue', 0.0)))})
+            out.append((_dt(r['timestamp']), float(r.get('portfolio_value', r.get('portfolioValue', 0.0)))))
         except Exception:
             continue
+    return out
+
+def merge_pulse_with_admin(pulse: list[dict], admin: list[dict], pv_pre: float | None = None) -> list[dict]:
+    today = datetime.now(timezone.utc).date()
+    pulse_pts = _points(pulse)
+    # Keep Pulse strictly before today
+    kept: list[dict] = [{'timestamp': _iso(t), 'portfolio_value': v} for t, v in pulse_pts if t.date() < today]
 
     # Admin points for today
-    admin_today: list[dict] = []
-    for a in admin:
-        try:
-            d = _dt(a['timestamp']).date()
-            if d == today:
-                admin_today.append({'timestamp': _iso(_dt(a['timestamp'])), 'portfolio_value': float(a.get('portfolio_value', a.get('portfolioValue', 0.0)))})
-        except Exception:
-            continue
+    admin_today: list[dict] = [{'timestamp': _iso(t), 'portfolio_value': v} for t, v in _points(admin) if t.date() == today]
     if not admin_today:
         return sorted(kept, key=lambda r: r['timestamp'])
 
@@ -95,11 +94,12 @@ def merge_pulse_with_admin(pulse: list[dict], admin: list[dict], pv_pre: float |
         pulse_open = float(pv_pre)
     else:
         # Fallback to last Pulse PV strictly before today (<= yday)
-        pulse_before = [p for p in pulse if _dt(p['timestamp']).date() <= yday]
+        pulse_before = [(t, v) for t, v in pulse_pts if t.date() <= yday]
         if pulse_before:
-            pulse_open = float(sorted(pulse_before, key=lambda r: _dt(r['timestamp']))[-1].get('portfolio_value', 1_000_000.0))
+            # max() over the reversed list picks the same row as a stable sort's [-1], without sorting
+            pulse_open = max(reversed(pulse_before), key=lambda p: p[0])[1]
         elif kept:
-            pulse_open = float(sorted(kept, key=lambda r: r['timestamp'])[-1]['portfolio_value'])
+            pulse_open = float(max(reversed(kept), key=lambda r: r['timestamp'])['portfolio_value'])
         else:
             pulse_open = 1_000_000.0
 
@@ -7,17 +7,25 @@ Triggered by CloudWatch Events every 5 minutes
 
 import json
 import urllib.request
-import urllib.parse
 from datetime import datetime, timezone
 import boto3
 from botocore.exceptions import ClientError
 import ssl
 import os
+import traceback
 
 # Configuration - can be overridden by environment variables
 S3_BUCKET = os.environ.get("S3_BUCKET", "dfi-signal-dashboard")
 S3_KEY_PREFIX = os.environ.get("S3_KEY_PREFIX", "signal-dashboard/data/")
 BINANCE_FUTURES_API = "https://fapi.binance.com/fapi/v1/premiumIndex"
+# Per-symbol/per-position debug lines are off unless VERBOSE=1
+VERBOSE = os.environ.get("VERBOSE", "0") == "1"
+DEBUG_SYMBOLS = frozenset({'BTCUSDT', 'ETHUSDT', 'XRPUSDT'})
+
+# SSL context that doesn't verify certificates (built once, reused by every request)
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
 # List of symbols to fetch prices for
 SYMBOLS_TO_FETCH = [
@@ -33,28 +41,43 @@ def log(msg: str) -> None:
     print(f"[{datetime.now().isoformat()}] {msg}")
 
 def get_mark_prices(symbols: list[str]) -> dict:
-    """Fetches current mark prices for a list of symbols from Binance Futures API."""
+    """Fetches current mark prices for a list of symbols from Binance Futures API.
+
+    premiumIndex without a symbol returns every instrument, so one request
+    covers the whole list instead of one round trip per symbol.
+    """
     prices = {}
-    
-    # Create SSL context that doesn't verify certificates
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    for symbol in symbols:
+
+    try:
+        with urllib.request.urlopen(BINANCE_FUTURES_API, context=SSL_CONTEXT, timeout=15) as response:
+            data = json.loads(response.read().decode())
+    except Exception as e:
+        log(f"❌ Error bulk fetching mark prices: {e}")
+        return prices
+
+    wanted = set(symbols)
+    for item in data if isinstance(data, list) else []:
         try:
-            params = urllib.parse.urlencode({'symbol': symbol})
-            url = f"{BINANCE_FUTURES_API}?{params}"
-            
-            with urllib.request.urlopen(url, context=ssl_context, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                mark_price = float(data['markPrice'])
+            symbol = item.get('symbol')
+            if symbol in wanted:
+                mark_price = float(item['markPrice'])
                 prices[symbol] = mark_price
-                log(f"✅ {symbol}: {mark_price}")
+                if VERBOSE:
+                    log(f"✅ {symbol}: {mark_price}")
         except Exception as e:
-            log(f"❌ Error fetching price for {symbol}: {e}")
+            log(f"❌ Error parsing price for {item}: {e}")
+
+    missing = wanted.difference(prices)
+    if missing:
+        log(f"⚠️ No mark price for: {', '.join(sorted(missing))}")
     return prices
 
+def csv_cell(values: list[str], idx, default):
+    """Stripped cell at idx; '' if the row is short, default if the column is absent."""
+    if idx is None:
+        return default
+    return values[idx].strip() if idx < len(values) else ''
+
 def load_s3_json(s3_client, key: str) -> dict:
     """Load a JSON file from S3 using boto3."""
     try:
@@ -192,26 +215,27 @@ def lambda_handler(event, context):
                 })
             }
         
-        headers = lines[0].split(',')
+        # Resolve the three columns we need once instead of building a dict per row
+        header_index = {h.strip(): j for j, h in enumerate(lines[0].split(','))}
+        ticker_idx = header_index.get('ticker')
+        notional_idx = header_index.get('target_notional')
+        contracts_idx = header_index.get('target_contracts')
         daily_pnl = 0.0
         positions_count = 0
 
         baseline_prices = baseline_data['prices']
 
-        for i in range(1, len(lines)):
-            if lines[i].strip():
-                values = lines[i].split(',')
-                position = {}
-                for j, header in enumerate(headers):
-                    position[header.strip()] = values[j].strip() if j < len(values) else ''
+        for line in lines[1:]:
+            if line.strip():
+                values = line.split(',')
 
-                symbol = position.get('ticker', '').replace('_', '')
+                symbol = csv_cell(values, ticker_idx, '').replace('_', '')
                 baseline_price = baseline_prices.get(symbol)
                 current_price = current_prices.get(symbol)
                 
                 try:
-                notional = float(position.get('target_notional', 0))
-                contracts = float(position.get('target_contracts', 0))
+                    notional = float(csv_cell(values, notional_idx, 0))
+                    contracts = float(csv_cell(values, contracts_idx, 0))
                 except (ValueError, TypeError):
                     continue
 
@@ -221,8 +245,8 @@ def lambda_handler(event, context):
                     daily_pnl += pnl
                     positions_count += 1
                     
-                    # Debug key positions
-                    if symbol in ['BTCUSDT', 'ETHUSDT', 'XRPUSDT']:
+                    # Debug key positions (only formatted when VERBOSE is on)
+                    if VERBOSE and symbol in DEBUG_SYMBOLS:
                         log(f"🔍 {symbol}: baseline={baseline_price}, current={current_price}, side={side}, pnl=${pnl:.2f}")
         
         # CORRECT FORMULA: Portfolio Value = pv_pre + Daily P&L
@@ -277,7 +301,6 @@ def lambda_handler(event, context):
         
     except Exception as e:
         log(f"❌ Lambda execution failed: {str(e)}")
-        import traceback
         log(f"Traceback: {traceback.format_exc()}")
         return {
             'statusCode': 500,
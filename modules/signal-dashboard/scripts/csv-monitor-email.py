@@ -1,6 +1,9 @@
 import os
+import re
 import sys
 import time
+import threading
+import traceback
 import datetime
 import subprocess
 import boto3
@@ -34,6 +37,8 @@ S3_DASHBOARD_KEY = 'signal-dashboard/dashboard.html'
 
 # detector-only switches
 PV_WRITER_ENABLED = os.getenv("PV_WRITER_ENABLED", "0") == "1"  # default OFF
+# Per-poll per-strategy trace lines are off unless VERBOSE=1
+VERBOSE = os.getenv("VERBOSE", "0") == "1"
 
 # Environment selection for S3 prefixes: ADMIN or PULSE (defaults to PULSE)
 ENV = os.getenv('ENV', 'ADMIN').upper()
@@ -61,7 +66,6 @@ def s3_prefix_for_env(env: str, strategy: str) -> str:
 def parse_stamp(name: str) -> tuple[int, int]:
     """Return (YYYYMMDD, HHMM) or (0,0)."""
     try:
-        import re
         m = re.search(r'(\d{8})-(\d{4})', name or '')
         return (int(m.group(1)), int(m.group(2))) if m else (0, 0)
     except Exception:
@@ -118,17 +122,11 @@ def sudo_stat_epoch(full_path: str) -> int:
 
 def get_latest_2355(dir_path: str) -> str | None:
     try:
-        files = sudo_listdir_sorted(dir_path)
-        latest_name = None
-        latest_ts = None
-        for name in files:
+        # `ls -t` lists newest first, so the first match is the latest; no per-file stat needed
+        for name in sudo_listdir_sorted(dir_path):
             if name.endswith(TARGET_SUFFIX):
-                fp = os.path.join(dir_path, name)
-                ts = sudo_stat_epoch(fp)
-                if latest_name is None or ts > latest_ts:
-                    latest_name = name
-                    latest_ts = ts
-        return latest_name
+                return name
+        return None
     except subprocess.CalledProcessError as e:
         log(f"sudo list/stat failed: {e.stderr.strip()}")
         return None
@@ -184,7 +182,6 @@ def update_dashboard_html_on_s3(new_csv_filename: str) -> bool:
 def write_latest_json(filename: str, strategy: str, sha256: str | None = None) -> bool:
     """Write a small latest.json with the newest CSV filename for the dashboard to consume."""
     s3 = boto3.client('s3')
-    import json
     payload = {
         'filename': filename,
         'latest_csv': filename,
@@ -206,7 +203,6 @@ def write_latest_json_both(filename: str, strategy: str, sha256: str | None = No
         log(f"DRY RUN: would write latest.json for {strategy} filename={filename}")
         return True
     s3 = boto3.client('s3')
-    import json
     payload = {
         'filename': filename,
         'latest_csv': filename,
@@ -228,7 +224,6 @@ def write_latest_json_both(filename: str, strategy: str, sha256: str | None = No
 def read_current_latest_json(strategy: str) -> str | None:
     """Return the filename currently referenced by latest.json on S3 (or None)."""
     s3 = boto3.client('s3')
-    import json
     try:
         obj = s3.get_object(Bucket=S3_BUCKET_NAME, Key=s3_prefix_for(strategy) + 'latest.json')
         data = json.loads(obj['Body'].read().decode('utf-8'))
@@ -409,7 +404,6 @@ def calculate_real_portfolio_value(csv_filename: str, strategy: str) -> dict:
         log(f"Number of positions parsed: {len(positions)}")
         log(f"Total notional calculated: {total_notional}")
         log(f"Current prices fetched: {len(current_prices)}")
-        import traceback
         log(f"Traceback: {traceback.format_exc()}")
         return None
 
@@ -486,7 +480,6 @@ def create_or_update_portfolio_log(csv_filename: str) -> bool:
                 'portfolio_value': portfolio_value,
                 'prices': portfolio_data.get('current_prices', {})
             }
-            import json
             s3.put_object(
                 Bucket=S3_BUCKET_NAME,
                 Key=S3_KEY_PREFIX + 'daily_baseline.json',
@@ -514,7 +507,6 @@ def write_daily_baseline_json(csv_filename: str, portfolio_value: float, prices:
             log('DRY RUN: would write daily_baseline.json')
             return True
         s3 = boto3.client('s3')
-        import json
         payload = {
             'timestamp_utc': datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
             'csv_filename': csv_filename,
@@ -797,7 +789,6 @@ def append_timeseries_point(csv_filename: str, portfolio_value: float, daily_pnl
     """Append one time series point to today's JSONL file and update latest.json."""
     try:
         s3 = boto3.client('s3')
-        import json
         
         now = datetime.datetime.utcnow()
         date_str = now.strftime('%Y-%m-%d')
@@ -903,8 +894,6 @@ def collect_rolling_ticks(csv_filename: str, base_cumulative: float, num_ticks:
 
 def continuous_timeseries_writer() -> None:
     """Background thread that writes time series points every minute."""
-    import threading
-    import time
     
     def writer_loop():
         while True:
@@ -1021,7 +1010,6 @@ def continuous_timeseries_writer() -> None:
 
 def main() -> None:
     # Console log capture for CSV monitoring
-    import sys
     
     log_filename = f"/tmp/csv_monitor_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     log_file = open(log_filename, 'w')
@@ -1075,8 +1063,10 @@ def main() -> None:
         for strategy, dir_path in STRATEGY_DIRS.items():
             latest = get_latest_2355(dir_path)
             prev_seen = last_processed.get(strategy)
-            s3_prev = read_current_latest_json(strategy)
-            log(f"🧭 latest[{strategy}]={latest} prev_seen={prev_seen} s3_latest={s3_prev}")
+            if VERBOSE:
+                # s3_latest is only read for this trace; skip the GET when it isn't logged
+                s3_prev = read_current_latest_json(strategy)
+                log(f"🧭 latest[{strategy}]={latest} prev_seen={prev_seen} s3_latest={s3_prev}")
             if not latest or latest == prev_seen:
                 continue
             any_updated = True
@@ -1177,7 +1167,6 @@ def main() -> None:
             try:
                 def parse_stamp(name: str) -> tuple:
                     # expected patterns like monitor_signal_DF_YYYYMMDD-HHMM.csv
-                    import re
                     m = re.search(r'(\d{8})-(\d{4})', name or '')
                     return (int(m.group(1)), int(m.group(2))) if m else (0, 0)
                 cand_d, cand_t = parse_stamp(latest)
@@ -6,6 +6,7 @@ import subprocess
 import sys
 import tempfile
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Dict
 
 
@@ -58,10 +59,14 @@ def parse_jsonl(text: str) -> List[Dict]:
     return out
 
 
+@lru_cache(maxsize=65536)
 def dt_from_iso(s: str) -> datetime:
+    # Memoized: the same timestamps are parsed repeatedly while ensuring EODs,
+    # merging and resampling; datetimes are immutable so sharing is safe.
     # Accept both 'Z' and '+00:00' suffixes
     if s.endswith("Z"):
-        return datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        # fromisoformat is C-implemented; strptime goes through the pure-Python _strptime module
+        return datetime.fromisoformat(s[:-1] + "+00:00")
     # Fallback: fromisoformat
     return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
 
@@ -124,14 +129,16 @@ def ensure_demo_eod_points(demo: List[Dict]) -> List[Dict]:
     """
     # Index demo by day and keep the latest timestamp per day as EOD
     by_day: Dict[str, Dict] = {}
+    latest_ts: Dict[str, datetime] = {}  # day -> timestamp of the point kept in by_day
     for p in demo:
         try:
             ts = dt_from_iso(p["timestamp"])
         except Exception:
             continue
         day = ts.date().isoformat()
-        cur = by_day.get(day)
-        if cur is None or dt_from_iso(cur["timestamp"]) < ts:
+        cur_ts = latest_ts.get(day)
+        if cur_ts is None or cur_ts < ts:
+            latest_ts[day] = ts
             by_day[day] = {
                 "timestamp": iso_from_dt(ts),
                 "portfolio_value": float(p.get("portfolio_value", p.get("portfolioValue", 0.0)))
@@ -169,9 +176,9 @@ def merge_demo_with_admin(demo: List[Dict], admin: List[Dict]) -> List[Dict]:
     kept: List[Dict] = []
     for p in demo:
         try:
-            d = dt_from_iso(p["timestamp"]).date()
-            if d < today:
-                kept.append({"timestamp": iso_from_dt(dt_from_iso(p["timestamp"])),
+            ts = dt_from_iso(p["timestamp"])
+            if ts.date() < today:
+                kept.append({"timestamp": iso_from_dt(ts),
                              "portfolio_value": float(p.get("portfolio_value", p.get("portfolioValue", 0.0)))})
         except Exception:
             continue
@@ -180,24 +187,25 @@ def merge_demo_with_admin(demo: List[Dict], admin: List[Dict]) -> List[Dict]:
     admin_today = []
     for p in admin:
         try:
-            d = dt_from_iso(p["timestamp"]).date()
-            if d == today:
-                admin_today.append({"timestamp": iso_from_dt(dt_from_iso(p["timestamp"])),
+            ts = dt_from_iso(p["timestamp"])
+            if ts.date() == today:
+                admin_today.append({"timestamp": iso_from_dt(ts),
                                     "portfolio_value": float(p.get("portfolio_value", p.get("portfolioValue", 0.0)))})
         except Exception:
             continue
 
     # If admin has no intraday today, just keep demo as-is
     if not admin_today:
-        return sorted(kept, key=lambda p: p["timestamp"])  # no change
+        return kept  # no change; already in timestamp order
 
     # Rebase today's admin PV to demo's opening PV (demo EOD from yesterday)
     # Find demo EOD for yesterday (today - 1 day). If not found, use last point before today.
-    yesterday = (today - timedelta(days=1)).isoformat()
-    demo_open_candidates = [p for p in demo if dt_from_iso(p["timestamp"]).date().isoformat() <= yesterday]
+    yesterday = today - timedelta(days=1)
+    demo_open_candidates = [p for p in demo if dt_from_iso(p["timestamp"]).date() <= yesterday]
     demo_open_pv = None
     if demo_open_candidates:
-        demo_open_pv = float(sorted(demo_open_candidates, key=lambda p: p["timestamp"]) [-1]["portfolio_value"])
+        # Latest candidate (ties resolve to the last one, as a stable sort would) without sorting
+        demo_open_pv = float(max(reversed(demo_open_candidates), key=lambda p: p["timestamp"])["portfolio_value"])
     else:
         demo_open_pv = float(demo[-1]["portfolio_value"]) if demo else 1_000_000.0
 
@@ -212,11 +220,13 @@ def merge_demo_with_admin(demo: List[Dict], admin: List[Dict]) -> List[Dict]:
         })
 
     resampled_today = resample_linear(rebased_today, every_minutes=5)
+    # kept comes from the sorted demo series and is strictly before today; the resampled
+    # grid is ascending and all today, so the concatenation is already in order.
     merged = kept + resampled_today
     # Ensure strictly increasing by timestamp and dedupe
     seen = set()
     unique: List[Dict] = []
-    for p in sorted(merged, key=lambda x: x["timestamp"]):
+    for p in merged:
         if p["timestamp"] in seen:
             continue
         seen.add(p["timestamp"])
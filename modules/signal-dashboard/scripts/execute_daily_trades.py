@@ -32,6 +32,7 @@ import csv
 import io
 import math
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Tuple
 
@@ -66,7 +67,9 @@ EXECUTE_TRADES = env("EXECUTE_TRADES", "false").lower() == "true"
 SCHEDULE_HHMM = env("SCHEDULE_HHMM", "0030")  # 00:30 UTC
 
 
+@lru_cache(maxsize=None)
 def s3() -> boto3.client:
+    """Return a process-wide S3 client (created once, shared by every helper)."""
     return boto3.client("s3", region_name=REGION)
 
 
@@ -137,7 +140,10 @@ def get_pv_pre(cutoff_utc: datetime) -> Tuple[float, str]:
         return 1_000_000.0, "N/A"
     pv_pre = None
     pv_ts = "N/A"
-    for line in raw.splitlines():
+    lines = raw.splitlines()
+    # The log is append-only (chronological): walk back from the tail and stop at
+    # the first entry strictly before cutoff instead of parsing the whole history.
+    for line in reversed(lines):
         line = line.strip()
         if not line:
             continue
@@ -150,7 +156,6 @@ def get_pv_pre(cutoff_utc: datetime) -> Tuple[float, str]:
             if dt < cutoff_utc:
                 pv_pre = rec.get("portfolio_value") or rec.get("portfolioValue")
                 pv_ts = ts
-            else:
                 break
         except Exception:
             continue
@@ -160,7 +165,7 @@ def get_pv_pre(cutoff_utc: datetime) -> Tuple[float, str]:
         try:
             last_pv = None
             last_ts = "N/A"
-            for line in reversed(raw.splitlines()):
+            for line in reversed(lines):
                 line = line.strip()
                 if not line:
                     continue
@@ -19,6 +19,11 @@ S3_KEY = "signal-dashboard/data/latest_prices.json"
 PULSE_KEY = "descartes-ml/signal-dashboard/data/latest_prices.json"
 BINANCE_API = "https://fapi.binance.com/fapi/v1/premiumIndex"
 
+# SSL context that doesn't verify certificates (built once, reused by every request)
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
 # Load baseline to get portfolio symbols
 def load_baseline_symbols():
     """Backwards-compatible: load symbols from Admin baseline if needed.
@@ -51,14 +56,10 @@ def fetch_all_mark_prices():
     Returns a dict { SYMBOL: markPrice } filtered to *USDT symbols.
     """
     prices = {}
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-
     try:
         url = BINANCE_API  # without symbol → returns array of all instruments
         req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, context=ssl_context, timeout=15) as response:
+        with urllib.request.urlopen(req, context=SSL_CONTEXT, timeout=15) as response:
             data = json.loads(response.read().decode())
             if isinstance(data, list):
                 for item in data:
@@ -140,11 +141,10 @@ def main():
                     # Import lazily to avoid unused warnings
                     def _get_current_prices(symbols_local):
                         prices_local = {}
-                        ctx = ssl.create_default_context(); ctx.check_hostname=False; ctx.verify_mode=ssl.CERT_NONE
                         for sym in symbols_local:
                             try:
                                 url = f"{BINANCE_API}?symbol={sym}"
-                                with urllib.request.urlopen(urllib.request.Request(url), context=ctx, timeout=10) as resp:
+                                with urllib.request.urlopen(urllib.request.Request(url), context=SSL_CONTEXT, timeout=10) as resp:
                                     d = json.loads(resp.read().decode()); prices_local[sym]=float(d.get('markPrice',0))
                             except Exception:
                                 prices_local[sym]=None
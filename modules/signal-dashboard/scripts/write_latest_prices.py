@@ -36,6 +36,7 @@ import csv
 import io
 import random
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Dict, List
 
@@ -73,7 +74,9 @@ REGION = get_env("REGION", "eu-west-1")
 LOOP_SECONDS = int(get_env("LOOP_SECONDS", "60"))
 
 
+@lru_cache(maxsize=None)
 def s3_client():
+    """Return a process-wide S3 client (created once, reused every loop)."""
     return boto3.client("s3", region_name=REGION)
 
 
@@ -111,10 +114,16 @@ def discover_symbols_from_latest_csv() -> List[str]:
         return []
 
 
+@lru_cache(maxsize=None)
+def http_session() -> requests.Session:
+    """Return a process-wide HTTP session so Binance calls reuse keep-alive connections."""
+    return requests.Session()
+
+
 def fetch_mark_price(symbol: str) -> float | None:
     """Fetch Binance futures mark price for a symbol (e.g., BTCUSDT)."""
     try:
-        r = requests.get(BINANCE_MARK_URL, params={"symbol": symbol}, timeout=10)
+        r = http_session().get(BINANCE_MARK_URL, params={"symbol": symbol}, timeout=10)
         if r.status_code != 200:
             logger.warning("Binance mark price HTTP %s for %s", r.status_code, symbol)
             return None